@@ -1,10 +1,29 @@
+import atexit
+import sys
+import time
+import weakref
+from collections import deque
+from threading import Event, RLock, Thread
+
 from rich.console import Console
 from rich.text import Text
 from rich.color import Color
 from rich.style import Style
 
+from .metrics import registry
+
+trace = registry.tracer("rui")
+
 default_Color = "#505050"
 
+# Buffered UIs still alive at exit get their pending lines flushed by a single hook.
+_buffered_uis = weakref.WeakSet()
+
+@atexit.register
+def _flush_buffered_uis():
+    for ui in list(_buffered_uis):
+        ui.flush()
+
 class CyperxCommandLineRichUI:
     """
     CyperxCommandLineRichUI provides a rich command-line interface for styled and gradient text output using the `rich` library.
@@ -17,6 +36,8 @@ class CyperxCommandLineRichUI:
         spacer (str): Spacer string between prompt and text.
         def_gradient (tuple[str, str]): Default gradient colors.
         len (int): Tracks the length of the text buffer for carriage return handling.
+        buffered (bool): When True, printed lines are batched and rendered at most `max_fps` times per second.
+        scrollback (deque[str]): Bounded ring buffer of the most recently written lines, as plain text ("\r" progress lines are not kept).
     Properties:
         him: Appends the prompt and spacer to the text buffer.
         his_notify: Appends a notification-style prompt to the text buffer.
@@ -27,8 +48,8 @@ class CyperxCommandLineRichUI:
         ERROR: Appends an "ERROR" notification to the text buffer.
         LOG: Appends a "LOG" notification to the text buffer.
     Methods:
-        __init__(who=">>", his_style=..., def_style=..., def_gradient=("...","...")):
-            Initializes the UI with prompt, styles, and gradient colors.
+        __init__(who=">>", his_style=..., def_style=..., def_gradient=("...","..."), buffered=False, max_fps=30, scrollback=1000):
+            Initializes the UI with prompt, styles, gradient colors and output buffering.
         his_gradient(*colors, style=None):
             Appends the prompt with a gradient style using the given colors.
         clear():
@@ -43,12 +64,17 @@ class CyperxCommandLineRichUI:
             Appends text to the buffer with the given style.
         print(*args, style=None, sep=" ", end="\n"):
             Prints the current text buffer to the console, with optional styling and formatting.
+        flush():
+            Renders any lines still pending in buffered mode.
     Notes:
         - Uses the `rich` library for text styling and console output.
         - Designed for interactive command-line applications needing rich text formatting.
         - Supports gradient coloring, styled notifications, and input prompts.
+        - In buffered mode lines that arrive between frames are rendered at the end of the frame by one background flusher thread per UI.
+        - When output is redirected (not a terminal, Jupyter or IDLE) styling and width wrapping are skipped and plain text is written;
+          lines printed with end="\r" are written with "\n" instead, and in buffered mode superseded "\r" lines are dropped.
     """
-    def __init__(self,who = ">>", his_style:Style = Style(color=default_Color,bold=True), def_style=Style(color=default_Color),def_gradient:tuple[str,str] = ("#ff0000","#0000ff")):
+    def __init__(self,who = ">>", his_style:Style = Style(color=default_Color,bold=True), def_style=Style(color=default_Color),def_gradient:tuple[str,str] = ("#ff0000","#0000ff"), buffered:bool = False, max_fps:float = 30, scrollback:int = 1000):
         self.text = Text()
         self.console = Console()
         self.his_style = his_style
@@ -57,6 +83,16 @@ class CyperxCommandLineRichUI:
         self.spacer = "  "  
         self.def_gradient = def_gradient
         self.len = 0
+        self.buffered = buffered
+        self.scrollback = deque(maxlen=scrollback)
+        self._pending = []
+        self._frame_interval = 1 / max_fps if max_fps > 0 else 0
+        self._last_render = 0.0
+        self._lock = RLock()
+        self._wake = Event()
+        self._flusher = None
+        if buffered:
+            _buffered_uis.add(self)
     
     # === CyperxCommandLineRichUI Methods and Properties ===
     @property
@@ -139,6 +175,8 @@ class CyperxCommandLineRichUI:
 
     def input(self, text: Text | str = "", style: Style = None):
         """Prompts for user input with styled text."""
+        if self.buffered:
+            self.flush()
         style = style or self.def_style
         text_ = Text(text)
         text_.stylize(style)
@@ -156,10 +194,87 @@ class CyperxCommandLineRichUI:
             if self.text.__len__() > self.len:
                 self.len = self.text.__len__()
             self.text.append(f"{" ".rjust(self.len - self.text.__len__())}")
-        self.console.print(self.text, end=end)
+        text = self.text
         self.clear()
+        if not self.buffered:
+            with trace("render"):
+                self._render([(text, end)])
+            return self
+        return self._enqueue(text, end)
+
+    def _is_plain(self):
+        """True when output is redirected (e.g. to a file), checked per render since `Console()` follows `sys.stdout`."""
+        console = self.console
+        return not console.is_terminal and not console.is_jupyter and "idlelib" not in sys.modules
+
+    def _enqueue(self, line, end):
+        """Queues a line in buffered mode, rendering now if a frame is due or waking the flusher for the end of the frame."""
+        with self._lock:
+            # A pending "\r" line would be overwritten on screen anyway, so drop it.
+            if self._pending and self._pending[-1][1] == "\r":
+                self._pending.pop()
+            self._pending.append((line, end))
+            if self._frame_interval - (time.monotonic() - self._last_render) > 0:
+                if self._flusher is None:
+                    self._flusher = Thread(target=self._flush_loop, args=(weakref.ref(self), self._wake), daemon=True)
+                    self._flusher.start()
+                self._wake.set()
+                return self
+        return self.flush()
+
+    @staticmethod
+    def _flush_loop(ui_ref, wake):
+        """Background flusher: renders pending lines at the end of each frame, exiting once the UI is collected."""
+        while True:
+            if not wake.wait(timeout=1.0):
+                if ui_ref() is None:
+                    return
+                continue
+            wake.clear()
+            ui = ui_ref()
+            if ui is None:
+                return
+            wait = ui._frame_interval - (time.monotonic() - ui._last_render)
+            del ui  # don't keep the UI alive while sleeping
+            if wait > 0:
+                time.sleep(wait)
+            ui = ui_ref()
+            if ui is None:
+                return
+            ui.flush()
+            del ui
+
+    def flush(self):
+        """Renders any lines still pending in buffered mode."""
+        with self._lock:
+            self._last_render = time.monotonic()
+            if not self._pending:
+                return self
+            pending, self._pending = self._pending, []
+            with trace("render"):
+                self._render(pending)
         return self
 
+    def _render(self, pending):
+        """Writes a batch of (Text, end) pairs to the console in as few writes as possible."""
+        # Only lines that stay on screen go to scrollback, not "\r" progress frames.
+        self.scrollback.extend(line.plain for line, end in pending if end != "\r")
+        if self._is_plain():
+            self.console.file.write("".join(line.plain + ("\n" if end == "\r" else end) for line, end in pending))
+            self.console.file.flush()
+            return
+        # The trailing "\r" line (if any) is printed on its own so it can be overwritten later.
+        last_end = pending[-1][1]
+        tail = pending.pop() if last_end == "\r" else None
+        if pending:
+            batch = Text()
+            for line, end in pending:
+                batch.append_text(line)
+                batch.append(end)
+            self.console.print(batch, end="")
+        if tail:
+            self.console.print(tail[0], end="\r")
+
     NOTIFY = notify
 
     @property
@@ -1,4 +1,31 @@
-from .event import EventDispatcher
-from .little_os import LITTLEOSError, LittleShellOutput, LITTLEOS
-from .file_dict import JSONDict, BSONDict
-from .RUI import CyperxCommandLineRichUI,Style
\ No newline at end of file
+import importlib
+
+# Public names are resolved on first access (PEP 562) so that importing the
+# package does not pull in `rich` or `bson` unless they are actually used.
+_LAZY_ATTRS = {
+    "EventDispatcher": ".event",
+    "LITTLEOSError": ".little_os",
+    "LittleShellOutput": ".little_os",
+    "LITTLEOS": ".little_os",
+    "JSONDict": ".file_dict",
+    "BSONDict": ".file_dict",
+    "CyperxCommandLineRichUI": ".RUI",
+    "Style": ".RUI",
+    "MetricsRegistry": ".metrics",
+    "registry": ".metrics",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # cache so __getattr__ is not hit again
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,67 @@
+"""
+Import-time benchmark for the package, based on `python -X importtime`.
+
+Runs each import in a fresh interpreter, reads the cumulative time reported
+for the top-level module and fails if it exceeds the budget.
+
+Usage:
+    python benchmarks/import_time.py [--budget-ms 10] [--runs 5]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = os.path.basename(PACKAGE_DIR)
+
+# Cumulative import time allowed for `import <package>`, in milliseconds.
+DEFAULT_BUDGET_MS = 10.0
+
+
+def import_time_us(statement, module):
+    """Runs `statement` in a fresh interpreter and returns the cumulative import time of `module` in microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=os.path.dirname(PACKAGE_DIR),
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"'{statement}' failed:\n{result.stderr}")
+    # Lines look like: "import time:   self [us] |  cumulative | imported package"
+    for line in result.stderr.splitlines():
+        parts = [p.strip() for p in line.removeprefix("import time:").split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1])
+    raise RuntimeError(f"no importtime entry for '{module}'")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    # Best of N, since the first run also pays for cold filesystem caches.
+    best_us = min(import_time_us(f"import {PACKAGE}", PACKAGE) for _ in range(args.runs))
+    best_ms = best_us / 1000
+    print(f"import {PACKAGE}: {best_ms:.2f} ms (budget {args.budget_ms:.2f} ms)")
+
+    heavy = subprocess.run(
+        [sys.executable, "-c", f"import sys, {PACKAGE}; print(' '.join(m for m in ('rich', 'bson') if m in sys.modules))"],
+        cwd=os.path.dirname(PACKAGE_DIR),
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+    if heavy:
+        print(f"FAIL: eagerly imported {heavy}")
+        return 1
+    if best_ms > args.budget_ms:
+        print("FAIL: import time over budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
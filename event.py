@@ -1,6 +1,22 @@
+import time
+from functools import partial
+
+from .metrics import registry
+
+trace = registry.tracer("event")
+
+
+def _listener_name(callback):
+    """Stable metrics label for a listener (no memory addresses, partials unwrapped)."""
+    while isinstance(callback, partial):
+        callback = callback.func
+    return getattr(callback, "__qualname__", None) or type(callback).__qualname__
+
+
 class EventDispatcher:
     def __init__(self):
         self._listeners = {}
+        self._listener_histograms = {}
 
     def on(self, event_name):
         """
@@ -20,6 +36,7 @@ class EventDispatcher:
         """
         if event_name in self._listeners and callback in self._listeners[event_name]:
             self._listeners[event_name].remove(callback)
+            self._listener_histograms.pop((event_name, id(callback)), None)
         else:
             ...
 
@@ -29,10 +46,29 @@ class EventDispatcher:
         Additional arguments are passed directly to the callbacks.
         """
         if event_name in self._listeners:
+            if registry.enabled:
+                return self._dispatch_timed(event_name, *args, **kwargs)
             for callback in self._listeners[event_name]:
                     callback(*args, **kwargs)
         else:
             ...
 
+    def _dispatch_timed(self, event_name, *args, **kwargs):
+        """
+        Same as dispatch, but records the time spent in each listener.
+        """
+        for callback in self._listeners[event_name]:
+            # Registered callbacks are kept alive by _listeners, so their id() is a safe cache key.
+            key = (event_name, id(callback))
+            histogram = self._listener_histograms.get(key)
+            if histogram is None:
+                histogram = self._listener_histograms[key] = registry.histogram(
+                    "event_listener_seconds", event=str(event_name), listener=_listener_name(callback))
+            start = time.perf_counter()
+            try:
+                callback(*args, **kwargs)
+            finally:
+                histogram.record(time.perf_counter() - start)
+
 
 base = EventDispatcher()
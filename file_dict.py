@@ -2,6 +2,10 @@ import json
 import os
 import tempfile
 
+from .metrics import registry
+
+trace = registry.tracer("file_dict")
+
 class JSONDict:
     """
     Dictionary-like object that persists its data to a JSON file.
@@ -38,17 +42,21 @@ class JSONDict:
             return json.load(f)
 
     def _write_file(self, path, data):
-        # Write dict to JSON file
+        # Write dict to JSON file, returns the number of bytes written
         with open(path, 'w') as f:
             json.dump(data, f, indent=4)
+            return f.tell()
 
     def flush(self):
         """Write the internal dict to the file."""
-        try:
-            self._write_file(self.filepath, self._data)
-        except PermissionError:
-            self._switch_to_temp_file()
-            self._write_file(self.filepath, self._data)
+        with trace("json_dict_flush"):
+            try:
+                written = self._write_file(self.filepath, self._data)
+            except PermissionError:
+                self._switch_to_temp_file()
+                written = self._write_file(self.filepath, self._data)
+        if registry.enabled:
+            registry.counter("file_dict_json_dict_flush_bytes_total").inc(written)
 
     # Dict-like methods
     def __getitem__(self, key):
@@ -84,8 +92,6 @@ class JSONDict:
         self._data.clear()
         self.flush()
 
-from bson import BSON, decode_all
-
 class BSONDict:
     """
     Dictionary-like object that persists its data to a BSON file.
@@ -118,22 +124,27 @@ class BSONDict:
 
     def _read_file(self, path):
         # Read BSON file and return dict
+        from bson import decode_all  # deferred so JSON-only users don't need pymongo
         with open(path, 'rb') as f:
             content = f.read()
             return decode_all(content)[0] if content else {}
 
     def _write_file(self, path, data):
         # Write dict to BSON file
+        from bson import BSON
         with open(path, 'wb') as f:
-            f.write(BSON.encode(data))
+            return f.write(BSON.encode(data))
 
     def flush(self):
         """Write the internal dict to the BSON file."""
-        try:
-            self._write_file(self.filepath, self._data)
-        except PermissionError:
-            self._switch_to_temp_file()
-            self._write_file(self.filepath, self._data)
+        with trace("bson_dict_flush"):
+            try:
+                written = self._write_file(self.filepath, self._data)
+            except PermissionError:
+                self._switch_to_temp_file()
+                written = self._write_file(self.filepath, self._data)
+        if registry.enabled:
+            registry.counter("file_dict_bson_dict_flush_bytes_total").inc(written)
 
     # Dict-like methods
     def __getitem__(self, key):
@@ -9,6 +9,9 @@ from threading import Thread,Event,main_thread
 from queue import Queue
 import subprocess
 
+from .metrics import Counter, registry
+
+trace = registry.tracer("little_os")
 
 
 class LITTLEOSError(Exception):
@@ -60,13 +63,22 @@ class LITTLEOS:
         return open(path, mode)
 
     def _Busy(self, commandId):
-        """Mark a command as busy (running)."""
-        self._currCommands[commandId] = True
+        """Mark a command as busy (running).
+        While metrics are enabled, tracks (submit time, output line Counter) for the command.
+        """
+        self._currCommands[commandId] = (time.perf_counter(), Counter()) if registry.enabled else True
 
-    def _Done(self, commandId=None):
-        """Mark a command as done (finished)."""
+    def _Done(self, commandId=None, record=True):
+        """Mark a command as done (finished).
+        Pass record=False to drop a command that was never sent without recording metrics for it.
+        """
         if commandId and commandId in self._currCommands:
-            del self._currCommands[commandId]
+            state = self._currCommands.pop(commandId, True)
+            if state is not True and record and registry.enabled:
+                elapsed = time.perf_counter() - state[0]
+                registry.histogram("little_os_command_seconds").record(elapsed)
+                if elapsed > 0:
+                    registry.histogram("little_os_command_lines_per_second").record(state[1].value / elapsed)
 
     def isBusy(self, commandId=None):
         """Check if the CMD process is currently busy with a command.
@@ -150,6 +162,14 @@ class LITTLEOS:
         except Exception as e:
             raise LITTLEOSError("could not create project", parent=e)
     
+    def _count_line(self, output_type):
+        """Count an output line, attributing it to the oldest running command (the shell runs them in order)."""
+        registry.counter("little_os_output_lines_total", stream=output_type).inc()
+        # Both reader threads land here, so the per-command count uses a (locked) Counter.
+        state = next(iter(self._currCommands.copy().values()), None)
+        if state is not None and state is not True:
+            state[1].inc()
+
     def _read_pipe_loop(self, pipe, output_type):
         """Generic loop to read from a given pipe and put into the queue."""
         while not self.stop_event.is_set():
@@ -167,6 +187,8 @@ class LITTLEOS:
                             ended = True
                     if not ended and " & echo" not in line.strip():
                         self.output_queue.put(LittleShellOutput(**{"type": output_type, "data": line.strip()}))
+                        if registry.enabled:
+                            self._count_line(output_type)
                 else:
                     
                     # If line is empty, pipe might be closed or EOF reached
@@ -230,21 +252,22 @@ class LITTLEOS:
         commandId = f"{uuid.uuid4().hex}--{self._currCommands.keys().__len__()}"  # Unique ID for this command
         if not self.is_running or not self.process or self.process.poll() is not None:
             raise LITTLEOSError(" CMD process not running or has terminated. Call .start() first.")
+        # Register before writing so the command's first output lines are attributed to it.
+        self._Busy(commandId)
         try:
             # Write command followed by a newline (Enter key) to execute it.
             self.process.stdin.write(command + f" & echo {commandId} " + os.linesep)
             self.process.stdin.flush() # Ensure the command is sent immediately
             self.output_queue.put(LittleShellOutput(**{"type": "stdinw", "data": command}))
-            self._Busy(commandId)
             time.sleep(0.01)  # Small delay to allow command to be processed
             return commandId
         except BrokenPipeError:
             self.is_running = False # Mark as not running
-            self._Done(commandId)
+            self._Done(commandId, record=False)
             raise LITTLEOSError("Error: stdin pipe is broken. CMD process might have terminated unexpectedly.")
         
         except Exception as e:
-            self._Done(commandId)
+            self._Done(commandId, record=False)
             # self.output_queue.put(LittleShellOutput(**{"type": "error", "data": f"Command send error: {e}"}))
             raise LITTLEOSError(f"Error sending command:",parent=e)
         
@@ -0,0 +1,211 @@
+import math
+import time
+from contextlib import nullcontext
+from threading import Lock
+
+
+class Counter:
+    """Monotonically increasing counter."""
+
+    def __init__(self):
+        self.value = 0
+        self._lock = Lock()
+
+    def inc(self, amount=1):
+        with self._lock:
+            self.value += amount
+
+
+class Histogram:
+    """
+    HDR-style histogram with log-linear buckets.
+    Each power of two is split into `SUB_BUCKETS` linear sub-buckets and percentiles
+    report the bucket midpoint, so they stay within 1/(2*SUB_BUCKETS) (~3.1%) of the
+    recorded value without storing every sample.
+    """
+
+    SUB_BUCKETS = 16
+
+    def __init__(self):
+        self._buckets = {}
+        self._zero = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self._lock = Lock()
+
+    def _index(self, value):
+        # frexp gives value = m * 2**e with m in [0.5, 1)
+        m, e = math.frexp(value)
+        return e, int((m - 0.5) * 2 * self.SUB_BUCKETS)
+
+    def _midpoint(self, index):
+        e, sub = index
+        return math.ldexp(0.5 + (sub + 0.5) / (2 * self.SUB_BUCKETS), e)
+
+    def record(self, value):
+        with self._lock:
+            if value > 0:
+                index = self._index(value)
+                self._buckets[index] = self._buckets.get(index, 0) + 1
+            else:
+                self._zero += 1
+            self.count += 1
+            self.sum += value
+            self.min = min(self.min, value)
+            self.max = max(self.max, value)
+
+    def percentile(self, q):
+        """Returns the value below which `q` percent of the recorded values fall."""
+        with self._lock:
+            if not self.count:
+                return 0.0
+            rank = max(1, math.ceil(self.count * q / 100))
+            seen = self._zero
+            if seen >= rank:
+                return max(self.min, 0.0)
+            for index in sorted(self._buckets):
+                seen += self._buckets[index]
+                if seen >= rank:
+                    return min(max(self._midpoint(index), self.min), self.max)
+            return self.max
+
+    def snapshot(self):
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else 0.0,
+            "max": self.max if self.count else 0.0,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+        }
+
+
+class _Trace:
+    """Context manager that records the elapsed time of its block into a histogram."""
+
+    __slots__ = ("histogram", "start")
+
+    def __init__(self, histogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.record(time.perf_counter() - self.start)
+        return False
+
+
+class MetricsRegistry:
+    """
+    Opt-in registry of counters and latency histograms.
+    Instrumented code checks `enabled` (or uses `trace`, which returns a shared
+    no-op context while disabled) so hooks cost next to nothing until `enable()` is called.
+    Example:
+        registry.enable()
+        with registry.trace("my_section_seconds"):
+            ...
+        print(registry.to_prometheus())
+    """
+
+    _NULL_TRACE = nullcontext()
+
+    def __init__(self):
+        self.enabled = False
+        self._counters = {}
+        self._histograms = {}
+        self._lock = Lock()
+
+    def enable(self):
+        self.enabled = True
+        return self
+
+    def disable(self):
+        self.enabled = False
+        return self
+
+    def reset(self):
+        """Drops all recorded metrics."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+        return self
+
+    def _get(self, store, factory, name, labels):
+        key = (name, tuple(sorted(labels.items())))
+        metric = store.get(key)
+        if metric is None:
+            with self._lock:
+                metric = store.setdefault(key, factory())
+        return metric
+
+    def counter(self, name, **labels) -> Counter:
+        """Returns the counter for `name` and `labels`, creating it if needed."""
+        return self._get(self._counters, Counter, name, labels)
+
+    def histogram(self, name, **labels) -> Histogram:
+        """Returns the histogram for `name` and `labels`, creating it if needed."""
+        return self._get(self._histograms, Histogram, name, labels)
+
+    def trace(self, name, **labels):
+        """Context manager timing its block into the `name` histogram (no-op while disabled)."""
+        if not self.enabled:
+            return self._NULL_TRACE
+        return _Trace(self.histogram(name, **labels))
+
+    def tracer(self, prefix):
+        """Returns a `trace(section, **labels)` helper recording into `<prefix>_<section>_seconds`."""
+        def trace(section, **labels):
+            if not self.enabled:
+                return self._NULL_TRACE
+            return _Trace(self.histogram(f"{prefix}_{section}_seconds", **labels))
+        return trace
+
+    @staticmethod
+    def _format_labels(labels, extra=()):
+        labels = tuple(labels) + tuple(extra)
+        if not labels:
+            return ""
+        def escape(value):
+            return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+        return "{" + ",".join(f'{k}="{escape(v)}"' for k, v in labels) + "}"
+
+    def snapshot(self) -> dict:
+        """Returns all metrics as a plain dict keyed by `name{labels}`."""
+        with self._lock:
+            counters = list(self._counters.items())
+            histograms = list(self._histograms.items())
+        return {
+            "counters": {name + self._format_labels(labels): c.value for (name, labels), c in counters},
+            "histograms": {name + self._format_labels(labels): h.snapshot() for (name, labels), h in histograms},
+        }
+
+    def to_prometheus(self) -> str:
+        """Returns all metrics in the Prometheus text exposition format (histograms as summaries)."""
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(self._histograms.items())
+        lines = []
+        typed = set()
+        for (name, labels), counter in counters:
+            if name not in typed:
+                lines.append(f"# TYPE {name} counter")
+                typed.add(name)
+            lines.append(f"{name}{self._format_labels(labels)} {counter.value}")
+        for (name, labels), histogram in histograms:
+            if name not in typed:
+                lines.append(f"# TYPE {name} summary")
+                typed.add(name)
+            for q in (0.5, 0.9, 0.99):
+                value = histogram.percentile(q * 100)
+                lines.append(f"{name}{self._format_labels(labels, [('quantile', q)])} {value!r}")
+            lines.append(f"{name}_sum{self._format_labels(labels)} {histogram.sum!r}")
+            lines.append(f"{name}_count{self._format_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+registry = MetricsRegistry()
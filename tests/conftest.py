@@ -0,0 +1,15 @@
+import importlib.util
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The repository root is the package itself, so load it under its import name
+# regardless of what the checkout directory is called.
+if "py_addons" not in sys.modules:
+    spec = importlib.util.spec_from_file_location(
+        "py_addons", os.path.join(ROOT, "__init__.py"), submodule_search_locations=[ROOT]
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["py_addons"] = module
+    spec.loader.exec_module(module)
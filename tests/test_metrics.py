@@ -0,0 +1,141 @@
+import math
+import random
+
+import pytest
+
+from py_addons.metrics import Histogram, MetricsRegistry
+
+
+def exact_percentile(values, q):
+    return values[max(1, math.ceil(len(values) * q / 100)) - 1]
+
+
+def test_percentile_within_error_bound():
+    rng = random.Random(1)
+    values = sorted(rng.lognormvariate(0, 2) for _ in range(20000))
+    histogram = Histogram()
+    for value in values:
+        histogram.record(value)
+    bound = 1 / (2 * Histogram.SUB_BUCKETS)
+    for q in (0.1, 1, 10, 25, 50, 75, 90, 99, 99.9, 100):
+        exact = exact_percentile(values, q)
+        assert abs(histogram.percentile(q) - exact) / exact <= bound
+
+
+def test_percentile_edge_cases():
+    histogram = Histogram()
+    assert histogram.percentile(50) == 0.0
+    histogram.record(0)
+    histogram.record(3.0)
+    assert histogram.percentile(50) == 0.0
+    assert histogram.percentile(100) == 3.0
+
+
+def test_disabled_tracer_returns_shared_noop():
+    registry = MetricsRegistry()
+    trace = registry.tracer("mod")
+    assert trace("section") is MetricsRegistry._NULL_TRACE
+    assert registry.trace("mod_section_seconds") is MetricsRegistry._NULL_TRACE
+    with trace("section"):
+        pass
+    assert registry.snapshot() == {"counters": {}, "histograms": {}}
+
+
+def test_enabled_tracer_records():
+    registry = MetricsRegistry().enable()
+    with registry.tracer("mod")("section", kind="x"):
+        pass
+    histograms = registry.snapshot()["histograms"]
+    assert histograms['mod_section_seconds{kind="x"}']["count"] == 1
+
+
+def test_to_prometheus():
+    registry = MetricsRegistry().enable()
+    registry.counter("lines_total", stream="stdout").inc(3)
+    registry.counter("lines_total", stream='a"b\\c\n').inc()
+    histogram = registry.histogram("op_seconds", op="flush")
+    histogram.record(0.5)
+    histogram.record(0.5)
+    assert registry.to_prometheus() == (
+        "# TYPE lines_total counter\n"
+        'lines_total{stream="a\\"b\\\\c\\n"} 1\n'
+        'lines_total{stream="stdout"} 3\n'
+        "# TYPE op_seconds summary\n"
+        'op_seconds{op="flush",quantile="0.5"} 0.5\n'
+        'op_seconds{op="flush",quantile="0.9"} 0.5\n'
+        'op_seconds{op="flush",quantile="0.99"} 0.5\n'
+        'op_seconds_sum{op="flush"} 1.0\n'
+        'op_seconds_count{op="flush"} 2\n'
+    )
+
+
+def test_empty_registry_exports_nothing():
+    assert MetricsRegistry().to_prometheus() == ""
+
+
+def test_reset():
+    registry = MetricsRegistry()
+    registry.counter("c").inc()
+    registry.reset()
+    assert registry.snapshot() == {"counters": {}, "histograms": {}}
+
+
+@pytest.fixture
+def global_registry():
+    from py_addons.metrics import registry
+    registry.reset().enable()
+    yield registry
+    registry.disable().reset()
+
+
+def test_event_listener_labels_are_stable(global_registry):
+    from functools import partial
+    from py_addons.event import EventDispatcher
+
+    class Handler:
+        def __call__(self, value):
+            pass
+
+    def handle(value, extra=None):
+        pass
+
+    dispatcher = EventDispatcher()
+    dispatcher.on("x")(Handler())
+    dispatcher.on("x")(Handler())
+    dispatcher.on("x")(partial(handle, extra=1))
+    for _ in range(3):
+        dispatcher.dispatch("x", 1)
+    histograms = global_registry.snapshot()["histograms"]
+    assert set(histograms) == {
+        'event_listener_seconds{event="x",listener="test_event_listener_labels_are_stable.<locals>.Handler"}',
+        'event_listener_seconds{event="x",listener="test_event_listener_labels_are_stable.<locals>.handle"}',
+    }
+    handler_key = 'event_listener_seconds{event="x",listener="test_event_listener_labels_are_stable.<locals>.Handler"}'
+    assert histograms[handler_key]["count"] == 6
+
+
+def test_little_os_done_respects_disable(global_registry):
+    from py_addons.little_os import LITTLEOS
+
+    os_ = LITTLEOS()
+    os_._Busy("a")
+    os_._count_line("stdout")
+    global_registry.disable()
+    os_._Done("a")
+    assert not os_.isBusy("a")
+    assert global_registry.snapshot()["histograms"] == {}
+
+
+def test_little_os_failed_send_is_not_recorded(global_registry):
+    from py_addons.little_os import LITTLEOS
+
+    os_ = LITTLEOS()
+    os_._Busy("a")
+    os_._Done("a", record=False)
+    os_._Busy("b")
+    os_._count_line("stdout")
+    os_._count_line("stdout")
+    os_._Done("b")
+    histograms = global_registry.snapshot()["histograms"]
+    assert histograms["little_os_command_seconds"]["count"] == 1
+    assert histograms["little_os_command_lines_per_second"]["count"] == 1
@@ -0,0 +1,76 @@
+import gc
+import io
+import time
+import weakref
+
+import pytest
+
+pytest.importorskip("rich")
+
+from rich.console import Console
+
+from py_addons.RUI import CyperxCommandLineRichUI
+
+
+def make_ui(**kwargs):
+    ui = CyperxCommandLineRichUI(**kwargs)
+    ui.console = Console(file=io.StringIO())  # not a terminal: plain output
+    return ui
+
+
+def test_buffered_print_delivers_all_lines_after_one_frame():
+    ui = make_ui(buffered=True, max_fps=10, scrollback=3)
+    ui.print("first")  # first frame is due immediately
+    for i in range(10):
+        ui.print(f"line{i}")
+    assert ui.console.file.getvalue() == "first\n"
+    time.sleep(0.3)
+    assert ui.console.file.getvalue() == "first\n" + "".join(f"line{i}\n" for i in range(10))
+    assert list(ui.scrollback) == ["line7", "line8", "line9"]
+
+
+def test_zero_scrollback_still_writes():
+    ui = make_ui(buffered=True, max_fps=1, scrollback=0)
+    for i in range(3):
+        ui.print(f"l{i}")
+    ui.flush()
+    assert ui.console.file.getvalue() == "l0\nl1\nl2\n"
+    assert list(ui.scrollback) == []
+
+
+def test_buffered_collapses_carriage_return_lines():
+    ui = make_ui(buffered=True, max_fps=1)
+    ui.flush()  # start a frame so following prints are queued
+    for i in range(5):
+        ui.print(f"progress {i}", end="\r")
+    ui.print("done")
+    ui.flush()
+    assert ui.console.file.getvalue() == "done\n"
+    assert list(ui.scrollback) == ["done"]
+
+
+def test_unbuffered_plain_writes_carriage_return_as_newline():
+    ui = make_ui()
+    ui.print("progress 10", end="\r")
+    ui.print("progress 9", end="\r")
+    assert ui.console.file.getvalue() == "progress 10 \nprogress 9 \n"
+
+
+def test_input_flushes_pending_lines():
+    ui = make_ui(buffered=True, max_fps=1)
+    ui.flush()
+    ui.print("please answer:")
+    ui.console.input = lambda prompt: ui.console.file.write("<prompt>") and "yes"
+    assert ui.input("?") == "yes"
+    assert ui.console.file.getvalue() == "please answer:\n<prompt>"
+
+
+def test_buffered_ui_is_collected():
+    ui = make_ui(buffered=True, max_fps=1)
+    ui.flush()
+    ui.print("x")
+    ref = weakref.ref(ui)
+    del ui
+    time.sleep(1.2)
+    gc.collect()
+    assert ref() is None